@@ -1,7 +1,6 @@
 import argparse
 import base64
 import json
-from pathlib import Path
 import sys
 import jsonschema
 from litellm import completion
@@ -22,6 +21,9 @@ DEFAULT_TEMPLATE = "default"
 CONFIG_FILE_EXTENSION = ".yml"
 JSON_FILE_EXTENSION = ".json"
 
+# Use the libyaml-backed loader when PyYAML was built with it
+YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
 # Configure logging
 logging.basicConfig(level=os.environ.get("CLLM_LOGLEVEL"))
 logger = logging.getLogger(__name__)
@@ -30,8 +32,8 @@ logger = logging.getLogger(__name__)
 def load_yaml_file(file_path: str) -> Dict[str, Any]:
     """Load a YAML file and return its contents as a dictionary."""
     try:
-        with open(file_path, 'r') as file:
-            return yaml.safe_load(file)
+        with open(file_path, 'rb') as file:
+            return yaml.load(file, Loader=YAML_LOADER)
     except Exception as e:
         logger.error(f"Error loading YAML file {file_path}: {e}")
         sys.exit(1)
@@ -40,7 +42,9 @@ def load_yaml_file(file_path: str) -> Dict[str, Any]:
 def list_available_items(directory: str, headers: list) -> None:
     """List available items in a directory and print them in a table format."""
     table_data = []
-    for path in [str(f) for f in Path(directory).rglob('*') if f.is_file()]:
+    for path in (os.path.join(root, name) for root, _, names in os.walk(directory) for name in names):
+        if not os.path.isfile(path):
+            continue
         data = load_yaml_file(path)
         name = path.replace(f"{directory}/", "").replace(CONFIG_FILE_EXTENSION, "")
         table_data.append([name] + [data.get(header) for header in headers[1:]])
@@ -89,6 +93,21 @@ def handle_schemas_command(cllm_dir: str) -> None:
     sys.exit(0)
 
 
+def save_chat_context(chat_context_path: str, messages: list) -> None:
+    """Write the chat context to a temporary file and atomically replace the old one."""
+    # Unique per process so concurrent runs on the same context never share a temp file
+    tmp_path = f"{chat_context_path}.{os.getpid()}.tmp"
+    try:
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            f.write(json.dumps(messages, indent=4))
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, chat_context_path)
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+
 def is_file(file_path: str) -> bool:
     """Check if a file exists."""
     return os.path.exists(file_path)
@@ -174,7 +193,7 @@ def cllm(command: str,
 
     if chat_context:
         try:
-            with open(chat_context_path, 'r') as f:
+            with open(chat_context_path, 'r', encoding='utf-8') as f:
                 messages = json.loads(f.read())
         except FileNotFoundError:
             pass
@@ -235,8 +254,7 @@ def cllm(command: str,
             messages.append({"role": "assistant", "content": response_message})
             if max_messages is not None and len(messages) > max_messages:
                 messages = messages[-max_messages:]
-            with open(chat_context_path, 'w') as f:
-                f.write(json.dumps(messages, indent=4))
+            save_chat_context(chat_context_path, messages)
                 
         return response_message
 
@@ -52,9 +52,11 @@ def save_images_locally(image_urls, output_dir):
         os.makedirs(output_dir)
     for i, url in enumerate(image_urls):
         if url:
-            image_data = requests.get(url).content
-            with open(os.path.join(output_dir, f"image_{i}.png"), 'wb') as f:
-                f.write(image_data)
+            with requests.get(url, stream=True, timeout=60) as response:
+                response.raise_for_status()
+                with open(os.path.join(output_dir, f"image_{i}.png"), 'wb') as f:
+                    for chunk in response.iter_content(chunk_size=65536):
+                        f.write(chunk)
             logging.info(f"Image saved to {os.path.join(output_dir, f'image_{i}.png')}")
 
 def main():
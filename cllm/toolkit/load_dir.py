@@ -33,7 +33,7 @@ def convert_docs_to_json(documents: List[Dict[str, Any]]) -> str:
     return json.dumps(docs_list, indent=2)
 
 def save_json_to_file(json_data: str, output_file: str) -> None:
-    with open(output_file, 'w') as f:
+    with open(output_file, 'w', encoding='utf-8') as f:
         f.write(json_data)
     logging.info(f"JSON data saved to {output_file}")
 
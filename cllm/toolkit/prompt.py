@@ -1,7 +1,6 @@
 import argparse
 import os
 import sys
-from pathlib import Path
 from jinja2 import Environment, FileSystemLoader
 from tabulate import tabulate
 import yaml
@@ -21,7 +20,9 @@ logger = logging.getLogger(__name__)
 def list_available_items(directory: str, headers: list) -> None:
     """List available items in a directory and print them in a table format."""
     table_data = []
-    for path in [str(f) for f in Path(directory).rglob('*') if f.is_file()]:
+    for path in (os.path.join(root, name) for root, _, names in os.walk(directory) for name in names):
+        if not os.path.isfile(path):
+            continue
         name = path.replace(f"{directory}/", "").replace(TEMPLATE_FILE_EXTENSION, "")
         table_data.append(name)
     print(table_data)